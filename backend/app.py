@@ -3,21 +3,42 @@ Full-Stack Audio Processing Backend
 Flask API for removing power line hum from audio files using IIR notch filters
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response
 from flask_cors import CORS
 import numpy as np
 from scipy import signal
-from scipy.fft import rfft, rfftfreq
+from scipy.fft import rfft
 from scipy.io import wavfile
 import io
 import base64
+import mmap
 import os
+import struct
+import tempfile
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+from functools import lru_cache
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Numba is optional - SciPy's sosfiltfilt is used as a fallback
+    NUMBA_AVAILABLE = False
+
+try:
+    # SIMD (AVX2/SSSE3) base64 encoder, ~4-10x faster than the stdlib
+    # on large buffers; drop-in replacement
+    import pybase64 as _b64
+except ImportError:
+    _b64 = base64
 
 app = Flask(__name__)
 
 # CORS Configuration - Allow frontend origin
 FRONTEND_URL = os.environ.get('FRONTEND_URL', 'http://localhost:3000')
-CORS(app, resources={r"/api/*": {"origins": [FRONTEND_URL, "http://localhost:3000"]}})
+CORS(app, resources={r"/api/*": {"origins": [FRONTEND_URL, "http://localhost:3000"]}},
+     expose_headers=['X-Sample-Rate', 'X-Hum-Frequency', 'X-Detected-Frequency',
+                     'X-Auto-Detected', 'X-Message'])
 
 
 # Enable response compression for better performance
@@ -29,6 +50,10 @@ ALLOWED_EXTENSIONS = {'wav', 'mp3', 'ogg', 'flac'}
 DEFAULT_HUM_FREQUENCY = 60
 DEFAULT_QUALITY_FACTOR = 30  # Higher Q = narrower notch (preserves more audio)
 MAX_HARMONICS = 5  # Remove fundamental + 4 harmonics
+# Edge-reflection length for zero-phase filtering. The Q=30 notch
+# transient settles within a few hundred samples, so a fixed 1024 keeps
+# residuals far below audibility with a bounded padded-buffer size.
+FILTER_PAD_SAMPLES = 1024
 DEBUG_MODE = False  # Set to True for detailed logging
 
 
@@ -37,13 +62,84 @@ def is_allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
 
+def _read_upload(file):
+    """
+    Spool an uploaded file to a temporary file and memory-map it.
+    The request never holds the upload as a Python bytes object; the
+    kernel pages sections in lazily as the WAV parser and filter touch
+    them. The returned mmap works anywhere a read-only buffer does.
+    """
+    with tempfile.TemporaryFile() as spool:
+        file.save(spool)
+        size = spool.tell()
+        if size == 0:
+            return b''
+        spool.flush()
+        return mmap.mmap(spool.fileno(), size, access=mmap.ACCESS_READ)
+
+
+def _load_wav_zerocopy(buf):
+    """
+    Parse a 16-bit PCM WAV held in memory without copying the sample bytes.
+    Walks the RIFF chunk list to locate 'fmt ' and 'data', builds an int16
+    view directly over the buffer with np.frombuffer, and normalizes to
+    float32 in a single fused multiply.
+
+    Returns:
+        (audio_data, sample_rate), or None if the buffer is not a plain
+        16-bit PCM WAV (caller falls back to scipy.io.wavfile)
+    """
+    if len(buf) < 12 or buf[:4] != b'RIFF' or buf[8:12] != b'WAVE':
+        return None
+
+    channels = sample_rate = bits_per_sample = None
+    data_offset = data_size = None
+
+    pos = 12
+    end = len(buf)
+    while pos + 8 <= end:
+        chunk_id = bytes(buf[pos:pos + 4])
+        chunk_size = int.from_bytes(buf[pos + 4:pos + 8], 'little')
+        body = pos + 8
+        if chunk_id == b'fmt ' and body + 16 <= end:
+            format_tag, channels, sample_rate = struct.unpack_from('<HHI', buf, body)
+            bits_per_sample = struct.unpack_from('<H', buf, body + 14)[0]
+            if format_tag != 1:  # uncompressed PCM only
+                return None
+        elif chunk_id == b'data':
+            data_offset = body
+            data_size = min(chunk_size, end - body)
+        # Chunks are word-aligned; odd sizes carry a pad byte
+        pos = body + chunk_size + (chunk_size & 1)
+
+    if channels is None or data_offset is None or bits_per_sample != 16:
+        return None
+
+    sample_count = (data_size // 2 // channels) * channels
+    pcm = np.frombuffer(buf, dtype='<i2', count=sample_count, offset=data_offset)
+
+    # Cast and scale in one pass straight into the float32 output
+    audio_data = np.empty(sample_count, dtype=np.float32)
+    np.multiply(pcm, np.float32(1.0 / 32768.0), out=audio_data)
+
+    if channels > 1:
+        audio_data = audio_data.reshape(-1, channels)
+    return audio_data, sample_rate
+
+
 def load_audio_file(file_data, file_extension):
     """
     Load audio file from bytes data efficiently.
     Returns: (audio_data, sample_rate)
     """
     if file_extension == 'wav':
-        # Use scipy for WAV files (fastest method)
+        # Fast path: build the sample array as a view over the upload
+        # buffer instead of letting wavfile.read memcpy the PCM bytes
+        loaded = _load_wav_zerocopy(file_data)
+        if loaded is not None:
+            return loaded
+
+        # Fall back to scipy for non-16-bit or unusual WAV layouts
         with io.BytesIO(file_data) as audio_buffer:
             sample_rate, audio_data = wavfile.read(audio_buffer)
             
@@ -85,35 +181,210 @@ def design_notch_filter(center_freq, sample_rate, quality_factor=30):
     """
     Design an IIR notch filter using scipy.signal.iirnotch.
     Optimized for power line hum removal.
-    
+
     Args:
         center_freq: Frequency to remove (Hz)
         sample_rate: Audio sample rate (Hz)
         quality_factor: Q factor (30 = narrow, precise notch)
-    
+
     Returns:
-        b, a: Filter coefficients (numerator, denominator)
+        sos: Filter coefficients as a second-order section (1, 6) array
     """
-    # Design notch filter - scipy automatically handles normalization
-    b, a = signal.iirnotch(center_freq, quality_factor, sample_rate)
-    return b, a
+    return _design_sos(center_freq, sample_rate, quality_factor)
+
+
+@lru_cache(maxsize=64)
+def _design_sos(freq, sr, q):
+    """
+    Design (and cache) a single notch SOS. Only a handful of distinct
+    (freq, sample_rate, Q) tuples ever occur, so after the first request
+    the design step is a dict lookup instead of SciPy calls.
+    """
+    # iirnotch already returns one normalized biquad (len(b) == len(a)
+    # == 3 with a[0] == 1), so assemble the (1, 6) SOS row directly
+    # instead of round-tripping through tf2sos
+    b, a = signal.iirnotch(freq, q, sr)
+    return np.array([[b[0], b[1], b[2], 1.0, a[1], a[2]]], dtype=np.float32)
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _sosfiltfilt_inplace(sos, x, npad):
+        """
+        Zero-phase SOS cascade applied in-place per channel.
+        x is planar (channels, samples), so each channel is a contiguous
+        row. Forward and reverse passes use Direct-Form-II-Transposed
+        biquads with scalar state, over an odd-reflection padded copy of
+        each channel to suppress startup transients. Channels run in
+        parallel.
+        """
+        n = x.shape[1]
+        n_sections = sos.shape[0]
+        for ch in prange(x.shape[0]):
+            padded = np.empty(n + 2 * npad, x.dtype)
+            for i in range(npad):
+                padded[i] = 2.0 * x[ch, 0] - x[ch, npad - i]
+                padded[n + npad + i] = 2.0 * x[ch, n - 1] - x[ch, n - 2 - i]
+            for i in range(n):
+                padded[npad + i] = x[ch, i]
+
+            m = padded.shape[0]
+            # Forward pass through all sections
+            for s in range(n_sections):
+                b0, b1, b2 = sos[s, 0], sos[s, 1], sos[s, 2]
+                a1, a2 = sos[s, 4], sos[s, 5]
+                z1 = 0.0
+                z2 = 0.0
+                for i in range(m):
+                    xi = padded[i]
+                    yi = b0 * xi + z1
+                    z1 = b1 * xi - a1 * yi + z2
+                    z2 = b2 * xi - a2 * yi
+                    padded[i] = yi
+            # Reverse pass (traversed backwards) for zero phase
+            for s in range(n_sections):
+                b0, b1, b2 = sos[s, 0], sos[s, 1], sos[s, 2]
+                a1, a2 = sos[s, 4], sos[s, 5]
+                z1 = 0.0
+                z2 = 0.0
+                for i in range(m - 1, -1, -1):
+                    xi = padded[i]
+                    yi = b0 * xi + z1
+                    z1 = b1 * xi - a1 * yi + z2
+                    z2 = b2 * xi - a2 * yi
+                    padded[i] = yi
+
+            for i in range(n):
+                x[ch, i] = padded[npad + i]
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _clip_scale_i16(x, out):
+        """
+        Fused clip to [-1, 1], scale to int16 range and cast.
+        One DRAM read and one DRAM write per sample instead of the
+        three separate full-buffer passes of clip/multiply/astype.
+        """
+        flat_x = x.ravel()
+        flat_out = out.ravel()
+        for i in prange(flat_x.size):
+            v = flat_x[i]
+            if v > 1.0:
+                v = 1.0
+            elif v < -1.0:
+                v = -1.0
+            flat_out[i] = np.int16(v * 32767.0)
+
+
+# Nearly all real-world audio arrives at one of these rates, and the
+# notch cascade for a given (rate, hum, Q) is fully fixed - so a handful
+# of specialized kernels with the coefficients baked in covers almost
+# every request
+_SPECIALIZED_RATES = (44100, 48000)
+_SPECIALIZED_KERNELS = {}
+
+
+def _make_fixed_sos_kernel(sos):
+    """
+    Compile a biquad-cascade kernel with the SOS coefficients embedded
+    as compile-time literals. The section tuple is frozen into the JIT
+    closure, so the inner loops carry no coefficient array loads and
+    LLVM can fold the multiplies per section.
+    """
+    sections = tuple(tuple(float(v) for v in row) for row in np.asarray(sos))
+
+    @njit(parallel=True, fastmath=True)
+    def kernel(x, npad):
+        n = x.shape[1]
+        for ch in prange(x.shape[0]):
+            padded = np.empty(n + 2 * npad, x.dtype)
+            for i in range(npad):
+                padded[i] = 2.0 * x[ch, 0] - x[ch, npad - i]
+                padded[n + npad + i] = 2.0 * x[ch, n - 1] - x[ch, n - 2 - i]
+            for i in range(n):
+                padded[npad + i] = x[ch, i]
+
+            m = padded.shape[0]
+            for row in sections:
+                b0, b1, b2, a1, a2 = row[0], row[1], row[2], row[4], row[5]
+                z1 = 0.0
+                z2 = 0.0
+                for i in range(m):
+                    xi = padded[i]
+                    yi = b0 * xi + z1
+                    z1 = b1 * xi - a1 * yi + z2
+                    z2 = b2 * xi - a2 * yi
+                    padded[i] = yi
+            for row in sections:
+                b0, b1, b2, a1, a2 = row[0], row[1], row[2], row[4], row[5]
+                z1 = 0.0
+                z2 = 0.0
+                for i in range(m - 1, -1, -1):
+                    xi = padded[i]
+                    yi = b0 * xi + z1
+                    z1 = b1 * xi - a1 * yi + z2
+                    z2 = b2 * xi - a2 * yi
+                    padded[i] = yi
+
+            for i in range(n):
+                x[ch, i] = padded[npad + i]
+
+    return kernel
+
+
+def _specialized_kernel(sample_rate, hum_freq, quality_factor):
+    """
+    Return the fixed-coefficient kernel for a common (rate, hum, Q)
+    combination, compiling it on first use, or None for anything else
+    (the generic kernel handles those).
+    """
+    if not NUMBA_AVAILABLE or sample_rate not in _SPECIALIZED_RATES:
+        return None
 
+    key = (sample_rate, hum_freq, quality_factor)
+    kernel = _SPECIALIZED_KERNELS.get(key)
+    if kernel is None:
+        sos = _harmonics_sos(hum_freq, sample_rate, quality_factor)
+        if sos is None:
+            return None
+        kernel = _make_fixed_sos_kernel(sos)
+        _SPECIALIZED_KERNELS[key] = kernel
+    return kernel
 
-def apply_notch_filter(audio_data, b, a):
+
+def apply_notch_filter(audio_data, sos, kernel=None):
     """
-    Apply notch filter to audio data using zero-phase filtering.
-    Optimized for both mono and stereo audio.
+    Apply a cascade of notch filters to audio data using zero-phase filtering.
+    Dispatches to the Numba biquad kernel when available (tight scalar loop,
+    channels in parallel; a coefficient-specialized kernel can be supplied
+    for the common sample rates); otherwise falls back to a single
+    axis-aware sosfiltfilt call, which runs all channels through contiguous
+    C code with no per-channel Python loop or repeated scratch-buffer setup.
     """
-    if len(audio_data.shape) == 1:
-        # Mono audio - use filtfilt for zero-phase filtering (no distortion)
-        return signal.filtfilt(b, a, audio_data)
+    # Interleaved (N, channels) stereo walks memory with a stride, using
+    # only 4 of every 64 cache-line bytes per channel. Transpose once to
+    # planar (channels, N) so each channel streams contiguously through
+    # the serial IIR recurrence; the one-time copy is cheaper than the
+    # strided traversals it avoids. Everything stays float32.
+    if audio_data.ndim == 2:
+        planar = np.ascontiguousarray(audio_data.T, dtype=np.float32)
+    else:
+        planar = np.ascontiguousarray(audio_data, dtype=np.float32).reshape(1, -1)
+
+    npad = min(planar.shape[1] - 1, FILTER_PAD_SAMPLES)
+    if NUMBA_AVAILABLE:
+        if kernel is not None:
+            kernel(planar, npad)
+        else:
+            _sosfiltfilt_inplace(np.ascontiguousarray(sos, dtype=np.float32), planar, npad)
+        filtered = planar
     else:
-        # Stereo audio - filter each channel independently
-        # Pre-allocate array for better memory efficiency
-        filtered_data = np.empty_like(audio_data)
-        for channel in range(audio_data.shape[1]):
-            filtered_data[:, channel] = signal.filtfilt(b, a, audio_data[:, channel])
-        return filtered_data
+        # sosfiltfilt promotes to float64 internally; bring the result
+        # back to float32 so downstream stages stay at half bandwidth
+        filtered = signal.sosfiltfilt(sos, planar, axis=1,
+                                      padlen=npad).astype(np.float32)
+
+    # Transpose back to (N, channels) - a view, no copy
+    return filtered.T if audio_data.ndim == 2 else filtered.reshape(-1)
 
 
 def detect_hum_frequency(audio_data, sample_rate):
@@ -130,40 +401,43 @@ def detect_hum_frequency(audio_data, sample_rate):
     else:
         audio_segment = audio_data[:analysis_samples]
     
-    # Compute FFT
-    fft_values = rfft(audio_segment)
-    fft_freqs = rfftfreq(len(audio_segment), 1/sample_rate)
-    
-    # Get magnitude spectrum
-    magnitude = np.abs(fft_values)
-    
-    # Define frequency ranges to check (±2 Hz around target frequencies)
-    freq_50_range = (48, 52)
-    freq_60_range = (58, 62)
-    
-    # Find indices for 50Hz and 60Hz ranges
-    idx_50 = np.where((fft_freqs >= freq_50_range[0]) & (fft_freqs <= freq_50_range[1]))[0]
-    idx_60 = np.where((fft_freqs >= freq_60_range[0]) & (fft_freqs <= freq_60_range[1]))[0]
-    
-    # Get peak magnitudes in each range
-    if len(idx_50) > 0:
-        peak_50 = np.max(magnitude[idx_50])
-    else:
-        peak_50 = 0
-    
-    if len(idx_60) > 0:
-        peak_60 = np.max(magnitude[idx_60])
-    else:
-        peak_60 = 0
-    
-    # Get average magnitude for comparison (excluding DC component)
-    avg_magnitude = np.mean(magnitude[1:])
-    
-    # Define threshold: peak should be at least 3x the average magnitude
-    threshold = avg_magnitude * 3
-    
-    print(f"Hum detection - 50Hz peak: {peak_50:.2f}, 60Hz peak: {peak_60:.2f}, Threshold: {threshold:.2f}")
-    
+    # Only bins up to ~62 Hz are ever inspected, so decimate to a few
+    # hundred Hz of bandwidth first - the FFT then runs on ~1k samples
+    # instead of the full-rate segment (e.g. 96k samples at 48 kHz)
+    decimation = max(1, sample_rate // 500)
+    if decimation > 1:
+        audio_segment = signal.decimate(audio_segment, decimation,
+                                        ftype='fir', zero_phase=True)
+    effective_rate = sample_rate / decimation
+
+    # Compute FFT. pocketfft can multithread large transforms; skip the
+    # thread launch for small (decimated) buffers. The decimated buffer
+    # is a private copy, so let the FFT consume it in place - but never
+    # overwrite when the segment is still a view into the caller's audio.
+    workers = -1 if len(audio_segment) > 8192 else 1
+    fft_values = rfft(audio_segment, workers=workers, overwrite_x=decimation > 1)
+
+    # Compare on squared magnitudes - same ordering as np.abs but skips
+    # the per-bin sqrt and the extra complex-abs allocation
+    magnitude_sq = np.square(fft_values.real) + np.square(fft_values.imag)
+
+    # FFT bins are spaced exactly effective_rate/N apart, so the ±2 Hz
+    # ranges around 50 and 60 Hz map to closed-form index slices - no
+    # need for rfftfreq or boolean-mask scans over the whole spectrum
+    df = effective_rate / len(audio_segment)
+    idx_50_lo, idx_50_hi = int(np.ceil(48 / df)), int(np.floor(52 / df)) + 1
+    idx_60_lo, idx_60_hi = int(np.ceil(58 / df)), int(np.floor(62 / df)) + 1
+
+    # Get peak squared magnitudes in each range
+    peak_50 = magnitude_sq[idx_50_lo:idx_50_hi].max(initial=0.0)
+    peak_60 = magnitude_sq[idx_60_lo:idx_60_hi].max(initial=0.0)
+
+    # Threshold: peak at least 3x the average magnitude, i.e. 9x the
+    # average squared magnitude (excluding the DC component)
+    threshold = 9.0 * np.mean(magnitude_sq[1:])
+
+    print(f"Hum detection - 50Hz peak: {np.sqrt(peak_50):.2f}, 60Hz peak: {np.sqrt(peak_60):.2f}, Threshold: {np.sqrt(threshold):.2f}")
+
     # Determine which frequency has stronger hum
     if peak_50 > threshold or peak_60 > threshold:
         if peak_50 > peak_60:
@@ -188,58 +462,155 @@ def remove_hum(audio_data, sample_rate, hum_freq=60, quality_factor=30):
         quality_factor: Q factor (30 = optimal for hum removal)
     
     Returns:
-        Filtered audio data (float64 from filtfilt)
+        Filtered audio data (float32)
+    """
+    if DEBUG_MODE:
+        print(f"Processing: SR={sample_rate}Hz, Nyquist={sample_rate / 2.0}Hz, Hum={hum_freq}Hz")
+
+    sos = _harmonics_sos(hum_freq, sample_rate, quality_factor)
+    if sos is None:
+        return audio_data
+
+    kernel = _specialized_kernel(sample_rate, hum_freq, quality_factor)
+    return apply_notch_filter(audio_data, sos, kernel)
+
+
+@lru_cache(maxsize=32)
+def _harmonics_sos(hum_freq, sample_rate, quality_factor):
+    """
+    Build (and cache) the stacked SOS cascade covering the fundamental
+    and every harmonic below Nyquist. Baking the harmonic list and the
+    Nyquist check in here collapses per-request filter design to a
+    single dict lookup. Returns None when no harmonic fits below Nyquist.
     """
     nyquist = sample_rate / 2.0
-    filtered_data = audio_data  # Work in-place for efficiency
-    
+    sections = [_design_sos(hum_freq * harmonic, sample_rate, quality_factor)
+                for harmonic in range(1, MAX_HARMONICS + 1)
+                if hum_freq * harmonic < nyquist]
+    if not sections:
+        return None
+    return np.vstack(sections)
+
+
+# Worker pool for the filter stage, created lazily so importing the app
+# (and the debug reloader's double import) doesn't fork workers
+_EXECUTOR = None
+_EXECUTOR_FAILED = False
+
+
+def _get_executor():
+    global _EXECUTOR, _EXECUTOR_FAILED
+    if _EXECUTOR is None and not _EXECUTOR_FAILED:
+        try:
+            _EXECUTOR = ProcessPoolExecutor(max_workers=os.cpu_count())
+        except OSError:
+            # Restricted environments may not allow subprocesses
+            _EXECUTOR_FAILED = True
+    return _EXECUTOR
+
+
+def _discard_executor(executor):
+    """
+    Drop a dead worker pool so the next request can create a fresh one
+    instead of hitting the same BrokenProcessPool forever.
+    """
+    global _EXECUTOR
+    if _EXECUTOR is executor:
+        _EXECUTOR = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def run_hum_removal(audio_data, sample_rate, hum_freq):
+    """
+    Run remove_hum in a worker process so a large upload does not hold
+    the serving process for seconds - multiple requests then filter in
+    parallel on multi-core machines. Falls back to inline filtering
+    when no worker pool is available or the pool's workers have died.
+    """
+    executor = _get_executor()
+    if executor is None:
+        return remove_hum(audio_data, sample_rate,
+                          hum_freq=hum_freq,
+                          quality_factor=DEFAULT_QUALITY_FACTOR)
+
+    try:
+        future = executor.submit(remove_hum, np.ascontiguousarray(audio_data),
+                                 sample_rate, hum_freq, DEFAULT_QUALITY_FACTOR)
+        return future.result()
+    except BrokenExecutor:
+        # A worker killed mid-job (e.g. OOM on a 50 MB upload) poisons
+        # the whole pool; discard it and finish this request inline
+        _discard_executor(executor)
+        return remove_hum(audio_data, sample_rate,
+                          hum_freq=hum_freq,
+                          quality_factor=DEFAULT_QUALITY_FACTOR)
+
+
+def _write_wav_buffer(audio_data, sample_rate):
+    """
+    Serialize audio data into an in-memory WAV file.
+
+    Returns:
+        BytesIO whose buffer is exactly the WAV contents (it is
+        preallocated to the final file size before writing)
+    """
+    # Convert float to int16 in a single fused pass when Numba is
+    # available; otherwise clip and scale in-place (float32 throughout)
+    # before the cast
+    if NUMBA_AVAILABLE:
+        audio_int16 = np.empty(audio_data.shape, np.int16)
+        _clip_scale_i16(np.ascontiguousarray(audio_data), audio_int16)
+    else:
+        np.clip(audio_data, -1.0, 1.0, out=audio_data)
+        np.multiply(audio_data, 32767.0, out=audio_data)
+        audio_int16 = audio_data.astype(np.int16)
+
     if DEBUG_MODE:
-        print(f"Processing: SR={sample_rate}Hz, Nyquist={nyquist}Hz, Hum={hum_freq}Hz")
-    
-    # Apply notch filters at fundamental and harmonics
-    # Remove up to MAX_HARMONICS for thorough hum removal
-    for harmonic in range(1, MAX_HARMONICS + 1):
-        target_freq = hum_freq * harmonic
-        
-        # Only filter if frequency is below Nyquist limit
-        if target_freq < nyquist:
-            if DEBUG_MODE:
-                print(f"  Filtering {target_freq}Hz (harmonic {harmonic})")
-            
-            b, a = design_notch_filter(target_freq, sample_rate, quality_factor)
-            filtered_data = apply_notch_filter(filtered_data, b, a)
-    
-    return filtered_data
+        print(f"Converting to WAV: range=[{audio_int16.min()}, {audio_int16.max()}]")
+
+    # Preallocate the buffer at its final size (44-byte canonical PCM
+    # header + payload) by zero-extending, so wavfile.write fills it in
+    # place instead of growing it through repeated realloc+memcpy
+    wav_buffer = io.BytesIO()
+    wav_buffer.seek(44 + audio_int16.nbytes - 1)
+    wav_buffer.write(b'\x00')
+    wav_buffer.seek(0)
+    wavfile.write(wav_buffer, sample_rate, audio_int16)
+    # wavfile.write seeks back to 0 when done, so the buffer's length -
+    # exactly the preallocated size - is the authoritative WAV size,
+    # not tell()
+
+    if DEBUG_MODE:
+        print(f"WAV size: {len(wav_buffer.getbuffer())} bytes")
+
+    return wav_buffer
+
+
+def save_audio_to_wav_bytes(audio_data, sample_rate):
+    """
+    Save audio data to an in-memory WAV file efficiently.
+
+    Returns:
+        WAV file contents as bytes
+    """
+    wav_buffer = _write_wav_buffer(audio_data, sample_rate)
+    # One exactly-sized copy out of the buffer (read() would do a second)
+    return bytes(wav_buffer.getbuffer())
 
 
 def save_audio_to_base64(audio_data, sample_rate):
     """
     Save audio data to WAV format and encode as base64 efficiently.
-    
+
     Returns:
         Base64 encoded string of WAV file
     """
-    # Clip to valid range to prevent overflow (in-place for efficiency)
-    np.clip(audio_data, -1.0, 1.0, out=audio_data)
-    
-    # Convert float to int16 for WAV format efficiently
-    audio_int16 = (audio_data * 32767).astype(np.int16)
-    
-    if DEBUG_MODE:
-        print(f"Converting to WAV: range=[{audio_int16.min()}, {audio_int16.max()}]")
-    
-    # Create WAV file in memory buffer
-    with io.BytesIO() as wav_buffer:
-        wavfile.write(wav_buffer, sample_rate, audio_int16)
-        wav_buffer.seek(0)
-        wav_bytes = wav_buffer.read()
-    
-    if DEBUG_MODE:
-        print(f"WAV size: {len(wav_bytes)} bytes")
-    
-    # Encode to base64 (most efficient method)
-    base64_audio = base64.b64encode(wav_bytes).decode('ascii')
-    
+    wav_buffer = _write_wav_buffer(audio_data, sample_rate)
+
+    # Encode straight from the buffer's memoryview - no intermediate
+    # bytes copy (SIMD-accelerated when pybase64 is installed)
+    base64_audio = _b64.b64encode(wav_buffer.getbuffer()).decode('ascii')
+
     return base64_audio
 
 
@@ -277,8 +648,8 @@ def process_audio():
             if hum_frequency not in [50, 60]:
                 return jsonify({'error': 'Hum frequency must be 50, 60, or "auto"'}), 400
         
-        # Read file data
-        file_data = file.read()
+        # Spool the upload to disk and memory-map it (no full in-RAM copy)
+        file_data = _read_upload(file)
         
         if len(file_data) > MAX_FILE_SIZE:
             return jsonify({'error': 'File too large. Maximum size: 50MB'}), 400
@@ -309,12 +680,7 @@ def process_audio():
                     print(f"No hum detected, defaulting to {hum_frequency} Hz")
         
         # Process audio - remove hum using cascaded notch filters
-        filtered_audio = remove_hum(
-            audio_data, 
-            sample_rate, 
-            hum_freq=hum_frequency,
-            quality_factor=DEFAULT_QUALITY_FACTOR
-        )
+        filtered_audio = run_hum_removal(audio_data, sample_rate, hum_frequency)
         
         if DEBUG_MODE:
             print(f"Filtered: shape={filtered_audio.shape}, dtype={filtered_audio.dtype}")
@@ -349,6 +715,91 @@ def process_audio():
         }), 500
 
 
+@app.route('/api/process-audio-binary', methods=['POST'])
+def process_audio_binary():
+    """
+    Process uploaded audio file to remove power line hum, returning the
+    WAV bytes directly instead of base64 JSON. Skipping base64 avoids a
+    33% size inflation plus two full-buffer string allocations per
+    request; metadata travels in X- response headers. The JSON route is
+    kept as a compatibility shim.
+
+    Expects:
+        - file: Audio file (multipart/form-data)
+        - humFrequency: "auto", 50, or 60 (optional, default "auto")
+
+    Returns:
+        audio/wav response with X-Sample-Rate, X-Hum-Frequency,
+        X-Detected-Frequency, X-Auto-Detected and X-Message headers
+    """
+    try:
+        # Validate file upload
+        if 'file' not in request.files:
+            return jsonify({'error': 'No file uploaded'}), 400
+
+        file = request.files['file']
+
+        if file.filename == '':
+            return jsonify({'error': 'No file selected'}), 400
+
+        if not is_allowed_file(file.filename):
+            return jsonify({'error': f'File type not supported. Allowed: {", ".join(ALLOWED_EXTENSIONS)}'}), 400
+
+        # Get hum frequency parameter (can be "auto", 50, or 60)
+        hum_frequency_param = request.form.get('humFrequency', 'auto')
+        auto_detect = hum_frequency_param == 'auto'
+
+        if not auto_detect:
+            hum_frequency = int(hum_frequency_param)
+            if hum_frequency not in [50, 60]:
+                return jsonify({'error': 'Hum frequency must be 50, 60, or "auto"'}), 400
+
+        # Spool the upload to disk and memory-map it (no full in-RAM copy)
+        file_data = _read_upload(file)
+
+        if len(file_data) > MAX_FILE_SIZE:
+            return jsonify({'error': 'File too large. Maximum size: 50MB'}), 400
+
+        # Get file extension
+        file_extension = file.filename.rsplit('.', 1)[1].lower()
+
+        # Load audio file
+        audio_data, sample_rate = load_audio_file(file_data, file_extension)
+
+        # Auto-detect hum frequency if requested
+        detected_freq = None
+        if auto_detect:
+            detected_freq = detect_hum_frequency(audio_data, sample_rate)
+            hum_frequency = detected_freq if detected_freq else DEFAULT_HUM_FREQUENCY
+
+        # Process audio - remove hum using cascaded notch filters
+        filtered_audio = run_hum_removal(audio_data, sample_rate, hum_frequency)
+
+        wav_bytes = save_audio_to_wav_bytes(filtered_audio, sample_rate)
+
+        # Build response message
+        if auto_detect:
+            if detected_freq:
+                message = f'Auto-detected and removed {hum_frequency} Hz hum and harmonics'
+            else:
+                message = f'No hum detected. Applied {hum_frequency} Hz filter as precaution'
+        else:
+            message = f'Successfully removed {hum_frequency} Hz hum and harmonics'
+
+        response = Response(wav_bytes, mimetype='audio/wav')
+        response.headers['X-Sample-Rate'] = str(int(sample_rate))
+        response.headers['X-Hum-Frequency'] = str(hum_frequency)
+        response.headers['X-Detected-Frequency'] = str(detected_freq) if detected_freq else ''
+        response.headers['X-Auto-Detected'] = 'true' if auto_detect else 'false'
+        response.headers['X-Message'] = message
+        return response
+
+    except Exception as e:
+        return jsonify({
+            'error': f'Processing failed: {str(e)}'
+        }), 500
+
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint."""
@@ -378,8 +829,8 @@ def detect_hum():
         if not is_allowed_file(file.filename):
             return jsonify({'error': f'File type not supported. Allowed: {", ".join(ALLOWED_EXTENSIONS)}'}), 400
         
-        # Read file data
-        file_data = file.read()
+        # Spool the upload to disk and memory-map it (no full in-RAM copy)
+        file_data = _read_upload(file)
         
         if len(file_data) > MAX_FILE_SIZE:
             return jsonify({'error': 'File too large. Maximum size: 50MB'}), 400
@@ -424,5 +875,7 @@ if __name__ == '__main__':
     print(f"API Endpoint: POST http://localhost:{port}/api/process-audio")
     print("=" * 60)
     
+    # Dev server only - in production run under gunicorn, e.g.
+    #   gunicorn -w 4 --worker-class gthread app:app
     app.run(debug=debug, port=port, host='0.0.0.0')
 
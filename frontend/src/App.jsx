@@ -306,16 +306,6 @@ const App = () => {
     [originalAudioUrl, processedAudioUrl, analyzeAudio, calculateEstimatedTime]
   );
 
-  const base64ToBlob = (base64, mimeType) => {
-    const byteCharacters = atob(base64);
-    const byteNumbers = new Array(byteCharacters.length);
-    for (let i = 0; i < byteCharacters.length; i++) {
-      byteNumbers[i] = byteCharacters.charCodeAt(i);
-    }
-    const byteArray = new Uint8Array(byteNumbers);
-    return new Blob([byteArray], { type: mimeType });
-  };
-
   const handleProcessAudio = useCallback(async () => {
     if (!selectedFile) {
       setError("Please select an audio file first");
@@ -348,7 +338,9 @@ const App = () => {
       formData.append("file", selectedFile);
       formData.append("humFrequency", humFrequency);
 
-      const response = await fetch(`${API_URL}/api/process-audio`, {
+      // Binary endpoint returns raw WAV bytes (no base64 decode needed);
+      // metadata arrives in X- response headers
+      const response = await fetch(`${API_URL}/api/process-audio-binary`, {
         method: "POST",
         body: formData,
         signal: abortController.signal,
@@ -386,20 +378,22 @@ const App = () => {
         }
       }
 
-      const data = await response.json();
+      const audioBlob = await response.blob();
       setUploadProgress(100);
 
       if (processedAudioUrl) {
         URL.revokeObjectURL(processedAudioUrl);
       }
 
-      const audioBlob = base64ToBlob(data.processedAudio, "audio/wav");
       const audioUrl = URL.createObjectURL(audioBlob);
+      const detectedFrequency = response.headers.get("X-Detected-Frequency");
+      const humFrequencyUsed = response.headers.get("X-Hum-Frequency");
+      const message = response.headers.get("X-Message");
 
       setProcessedAudioUrl(audioUrl);
-      setProcessedAudioData(data.processedAudio);
-      setDetectedHumFrequency(data.detectedFrequency || data.humFrequency);
-      setSuccessMessage(data.message || "Audio processed successfully!");
+      setProcessedAudioData(audioBlob);
+      setDetectedHumFrequency(detectedFrequency || humFrequencyUsed);
+      setSuccessMessage(message || "Audio processed successfully!");
       setShowSuccess(true);
       setLastError(null);
 
@@ -437,8 +431,7 @@ const App = () => {
   const handleDownload = useCallback(() => {
     if (!processedAudioData) return;
 
-    const audioBlob = base64ToBlob(processedAudioData, "audio/wav");
-    const url = URL.createObjectURL(audioBlob);
+    const url = URL.createObjectURL(processedAudioData);
     const a = document.createElement("a");
     a.href = url;
     a.download = `${selectedFile.name.split(".")[0]}_clean.wav`;